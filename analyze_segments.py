@@ -1,18 +1,29 @@
+import math
+
 import pandas as pd
 
 def analyze_customers(file_path):
-    # Read the CSV file
-    df = pd.read_csv(file_path)
+    # Read only the columns used below; segment has a handful of distinct values
+    df = pd.read_csv(
+        file_path,
+        usecols=['customer_id', 'segment', 'lifetime_value', 'loss_ratio'],
+        dtype={'customer_id': 'int64', 'segment': 'category',
+               'lifetime_value': 'float64', 'loss_ratio': 'float64'},
+    )
     
-    # Count customers in each segment
-    segment_counts = df['segment'].value_counts()
+    # Count customers in each segment; ties are listed alphabetically so the
+    # order does not depend on the category ordering or row order
+    segment_counts = (df['segment'].value_counts()
+                      .sort_index(kind='stable')
+                      .sort_values(ascending=False, kind='stable'))
     
-    # Find highest-risk customers (lowest lifetime value and highest loss ratio)
-    high_risk = df.sort_values(by=['lifetime_value', 'loss_ratio'], 
-                              ascending=[True, False])
+    # Find highest-risk customers (lowest lifetime value and highest loss ratio);
+    # keep='all' retains lifetime value ties so the loss ratio can break them
+    high_risk = df.nsmallest(3, 'lifetime_value', keep='all')
     
     # Get the top 3 highest risk customers
-    top_risks = high_risk.head(3)
+    top_risks = high_risk.sort_values(by=['lifetime_value', 'loss_ratio'],
+                                      ascending=[True, False]).head(3)
     
     # Print the summary
     print("CUSTOMER SEGMENT ANALYSIS")
@@ -22,12 +33,12 @@ def analyze_customers(file_path):
         print(f"- {segment}: {count} customers")
     
     print("\nHIGHEST-RISK CUSTOMERS:")
-    for _, row in top_risks.iterrows():
-        print(f"\nCustomer ID: {row['customer_id']}")
-        print(f"Segment: {row['segment']}")
-        print(f"Lifetime Value: ${row['lifetime_value']:,.2f}")
-        if pd.notna(row['loss_ratio']):
-            print(f"Loss Ratio: {row['loss_ratio']:.2f}%")
+    for row in top_risks.itertuples(index=False):
+        print(f"\nCustomer ID: {row.customer_id}")
+        print(f"Segment: {row.segment}")
+        print(f"Lifetime Value: ${row.lifetime_value:,.2f}")
+        if not math.isnan(row.loss_ratio):
+            print(f"Loss Ratio: {row.loss_ratio:.2f}%")
     
     print("\nRECOMMENDED NEXT STEPS:")
     print("1. Immediate manual review of the top 3 highest-risk customers")